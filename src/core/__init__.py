@@ -9,11 +9,12 @@
 # Re-export main components from submodules for convenience
 from .env_server import *
 from .client_types import StepResult
-from .http_env_client import HTTPEnvClient
+from .http_env_client import BatchStepError, HTTPEnvClient
 
 # Note: MCP module doesn't export anything yet
 
 __all__ = [
+    "BatchStepError",
     "HTTPEnvClient",
     "StepResult",
 ]
@@ -6,7 +6,7 @@ from typing import Any, Generic, Optional, TypeVar
 ObsT = TypeVar("ObsT")  # TypeVar for typehinting in IDEs
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult(Generic[ObsT]):
     """
     Represents the result of one environment step.
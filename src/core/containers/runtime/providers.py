@@ -13,6 +13,9 @@ This module provides a pluggable architecture for different container providers
 
 from __future__ import annotations
 
+import socket
+import subprocess
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
@@ -109,8 +112,6 @@ class LocalDockerProvider(ContainerProvider):
         self._container_name: Optional[str] = None
 
         # Check if Docker is available
-        import subprocess
-
         try:
             subprocess.run(
                 ["docker", "version"],
@@ -142,9 +143,6 @@ class LocalDockerProvider(ContainerProvider):
         Returns:
             Base URL to connect to the container
         """
-        import subprocess
-        import time
-
         # Find available port if not specified
         if port is None:
             port = self._find_available_port()
@@ -176,9 +174,6 @@ class LocalDockerProvider(ContainerProvider):
             error_msg = f"Failed to start Docker container.\nCommand: {' '.join(cmd)}\nExit code: {e.returncode}\nStderr: {e.stderr}\nStdout: {e.stdout}"
             raise RuntimeError(error_msg) from e
 
-        # Wait a moment for container to start
-        time.sleep(1)
-
         base_url = f"http://localhost:{port}"
         return base_url
 
@@ -189,8 +184,6 @@ class LocalDockerProvider(ContainerProvider):
         if self._container_id is None:
             return
 
-        import subprocess
-
         try:
             # Stop container
             subprocess.run(
@@ -225,11 +218,13 @@ class LocalDockerProvider(ContainerProvider):
         Raises:
             TimeoutError: If container doesn't become ready
         """
-        import time
         import requests
 
         start_time = time.time()
         health_url = f"{base_url}/health"
+        # Back off exponentially from 50ms (capped at 1s) so a server that comes
+        # up quickly is picked up almost immediately
+        delay = 0.05
 
         while time.time() - start_time < timeout_s:
             try:
@@ -239,7 +234,8 @@ class LocalDockerProvider(ContainerProvider):
             except requests.RequestException:
                 pass
 
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
 
         raise TimeoutError(
             f"Container at {base_url} did not become ready within {timeout_s}s"
@@ -252,8 +248,6 @@ class LocalDockerProvider(ContainerProvider):
         Returns:
             An available port number
         """
-        import socket
-
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.bind(("", 0))
             s.listen(1)
@@ -270,8 +264,6 @@ class LocalDockerProvider(ContainerProvider):
         Returns:
             A unique container name
         """
-        import time
-
         clean_image = image.split("/")[-1].split(":")[0]
         timestamp = int(time.time() * 1000)
         return f"{clean_image}-{timestamp}"
@@ -19,7 +19,8 @@ from typing import Any, Dict, Type
 
 from .interfaces import Environment
 from .types import Action, Observation
-from fastapi import Body, FastAPI
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
 
 class HTTPEnvServer:
     """
@@ -96,6 +97,45 @@ class HTTPEnvServer:
             # Return serialized observation
             return self._serialize_observation(observation)
 
+        @app.post("/batch_step")
+        async def batch_step(request: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Batch step endpoint - executes several actions in one request.
+
+            All actions are deserialized before any is applied, so a malformed
+            batch is rejected with 422 without changing the environment.
+            Actions are then applied in order and stop early once an
+            observation reports done. If a step raises, the results of the
+            actions already applied are returned together with an ``error``
+            entry giving the index of the failing action.
+            """
+            actions = []
+            for index, action_data in enumerate(request.get("actions", [])):
+                try:
+                    actions.append(self._deserialize_action(action_data))
+                except (AttributeError, TypeError, ValueError) as e:
+                    raise HTTPException(
+                        status_code=422,
+                        detail=f"Invalid action at index {index}: {e}",
+                    ) from e
+
+            results = []
+            for index, action in enumerate(actions):
+                try:
+                    observation = self.env.step(action)
+                except Exception as e:
+                    return {
+                        "results": results,
+                        "error": {
+                            "index": index,
+                            "message": f"{type(e).__name__}: {e}",
+                        },
+                    }
+                results.append(self._serialize_observation(observation))
+                if observation.done:
+                    break
+            return {"results": results}
+
         @app.get("/state")
         async def get_state() -> Dict[str, Any]:
             """State endpoint - returns current environment state."""
@@ -228,6 +268,11 @@ def create_fastapi_app(
         )
 
     app = FastAPI(title="Environment HTTP Server")
+    # Compress large observations (e.g. image frames serialized as lists);
+    # HTTPEnvClient's requests session accepts and decodes gzip transparently.
+    # Level 1 keeps per-step compression to a few ms; higher levels cost tens
+    # to hundreds of ms on large frames for little extra size reduction.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
     server = HTTPEnvServer(env, action_cls, observation_cls)
     server.register_routes(app)
     return app
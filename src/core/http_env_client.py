@@ -1,7 +1,8 @@
 """
 core/runner_env.py
 Minimal HTTP-based environment client.
-- Talks to a single env worker exposing: POST /reset, POST /step
+- Talks to a single env worker exposing: POST /reset, POST /step,
+  POST /batch_step, GET /state
 
 Future hooks (commented below) for:
 - episode_id, seed on reset
@@ -12,9 +13,16 @@ Future hooks (commented below) for:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Optional, Type, TYPE_CHECKING, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TYPE_CHECKING, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .client_types import StepResult
 from .containers.runtime import LocalDockerProvider
@@ -27,6 +35,42 @@ ObsT = TypeVar("ObsT")
 EnvClientT = TypeVar("EnvClientT", bound="HTTPEnvClient")
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    orjson is enabled by the optional ``fast`` extra. Unlike the stdlib
+    decoder, it turns integers wider than 64 bits into floats, so
+    observations carrying such values lose precision when it is active.
+
+    Invalid JSON raises requests.exceptions.JSONDecodeError with either
+    decoder, so callers can keep catching requests.RequestException.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(
+                e.msg, e.doc, e.pos, response=response
+            ) from e
+    return response.json()
+
+
+class BatchStepError(RuntimeError):
+    """
+    Raised when an action inside a batch_step() call fails on the server.
+
+    Attributes:
+        index: Position of the failing action in the batch
+        results: StepResults of the actions applied before the failure
+    """
+
+    def __init__(self, message: str, index: int, results: List[StepResult[Any]]):
+        super().__init__(f"Action {index} failed: {message}")
+        self.index = index
+        self.results = results
+
+
 class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
     def __init__(
         self,
@@ -37,7 +81,15 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
     ):
         self._base = base_url.rstrip("/")
         self._timeout = float(request_timeout_s)
+        # Keep-alive session with a pool for the single env host (up to 16
+        # connections), reused across reset/step/state and released by close().
+        # Only connection failures are retried: the request never reached the
+        # server, so resending a non-idempotent step is safe.
         self._http = requests.Session()
+        retries = Retry(total=3, connect=3, read=False, status=False, backoff_factor=0.05)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
         self._headers = default_headers or {}
         self._provider = provider
 
@@ -54,7 +106,8 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
         This is a development utility that:
         1. Starts a Docker container from the specified image
         2. Waits for the server to be ready
-        3. Creates and returns a client instance connected to the container
+        3. Creates a client instance connected to the container
+        4. Opens the client's pooled connection with a /health request
 
         Note: The container lifecycle management is left to the user or higher-level
         orchestration. The container will keep running until manually stopped.
@@ -102,8 +155,21 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
         # 2. Wait for server to be ready
         provider.wait_for_ready(base_url)
 
-        # 3. Create and return client instance with provider reference
-        return cls(base_url=base_url, provider=provider)
+        # 3. Create client instance with provider reference
+        client = cls(base_url=base_url, provider=provider)
+
+        # 4. Warm up the pooled keep-alive connection so the first reset()
+        # doesn't pay the connection setup cost
+        try:
+            client._http.get(
+                f"{client._base}/health",
+                headers=client._headers,
+                timeout=client._timeout,
+            )
+        except requests.RequestException:
+            pass
+
+        return client
 
     @classmethod
     def from_hub(cls: Type[EnvClientT], repo_id: str, provider: Optional["ContainerProvider"] = None, **kwargs: Any) -> EnvClientT:
@@ -151,7 +217,7 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
             timeout=self._timeout,
         )
         r.raise_for_status()
-        return self._parse_result(r.json())
+        return self._parse_result(_decode_json(r))
 
     def step(self, action: ActT) -> StepResult[ObsT]:
         body: Dict[str, Any] = {
@@ -168,7 +234,61 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
             timeout=self._timeout,
         )
         r.raise_for_status()
-        return self._parse_result(r.json())
+        return self._parse_result(_decode_json(r))
+
+    def batch_step(
+        self,
+        actions: List[ActT],
+        timeout_s: Optional[float] = None,
+    ) -> List[StepResult[ObsT]]:
+        """
+        Execute several actions in a single round-trip.
+
+        The server applies the actions in order, exactly as if step() had been
+        called for each one, and stops early if the episode ends. A malformed
+        action rejects the whole batch before anything is applied.
+
+        A client-side timeout does not cancel the batch on the server: actions
+        may still be applied after the request times out.
+
+        Args:
+            actions: Actions to execute, in order
+            timeout_s: Request timeout for the whole batch. Defaults to the
+                per-step timeout multiplied by the number of actions.
+
+        Returns:
+            One StepResult per executed action
+
+        Raises:
+            BatchStepError: If an action fails on the server. The results of
+                the actions applied before it are available on the exception.
+
+        Example:
+            >>> results = client.batch_step([
+            ...     EchoAction(message="a"),
+            ...     EchoAction(message="b"),
+            ... ])
+            >>> print([r.observation.echoed_message for r in results])
+        """
+        if timeout_s is None:
+            timeout_s = self._timeout * max(1, len(actions))
+        body: Dict[str, Any] = {
+            "actions": [self._step_payload(action) for action in actions],
+            "timeout_s": int(timeout_s),
+        }
+        r = self._http.post(
+            f"{self._base}/batch_step",
+            json=body,
+            headers=self._headers,
+            timeout=timeout_s,
+        )
+        r.raise_for_status()
+        payload = _decode_json(r)
+        results = [self._parse_result(result) for result in payload["results"]]
+        error = payload.get("error")
+        if error is not None:
+            raise BatchStepError(error["message"], error["index"], results)
+        return results
 
     def state(self) -> Any:
         """
@@ -190,14 +310,29 @@ class HTTPEnvClient(ABC, Generic[ActT, ObsT]):
             timeout=self._timeout,
         )
         r.raise_for_status()
-        return self._parse_state(r.json())
+        return self._parse_state(_decode_json(r))
 
     def close(self) -> None:
         """
         Close the environment and clean up resources.
 
-        If this client was created via from_docker_image(), this will stop
-        and remove the associated container.
+        Releases the pooled HTTP connection. If this client was created via
+        from_docker_image(), this will also stop and remove the associated
+        container.
         """
+        self._http.close()
         if self._provider is not None:
             self._provider.stop_container()
+
+    def __enter__(self: EnvClientT) -> EnvClientT:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """
+        Close the client when leaving a ``with`` block.
+
+        Example:
+            >>> with EchoEnv.from_docker_image("echo-env:latest") as client:
+            ...     result = client.reset()
+        """
+        self.close()
@@ -0,0 +1,29 @@
+"""Shared fixtures for core client/server tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.env_server.http_server import create_fastapi_app
+from envs.echo_env.client import EchoEnv
+from envs.echo_env.models import EchoAction, EchoObservation
+from envs.echo_env.server.echo_environment import EchoEnvironment
+
+
+@pytest.fixture
+def echo_env():
+    """A fresh EchoEnvironment instance."""
+    return EchoEnvironment()
+
+
+@pytest.fixture
+def echo_server(echo_env):
+    """In-process HTTP server wrapping ``echo_env``."""
+    return TestClient(create_fastapi_app(echo_env, EchoAction, EchoObservation))
+
+
+@pytest.fixture
+def echo_client(echo_server):
+    """EchoEnv client whose session is routed to ``echo_server``."""
+    client = EchoEnv(base_url="http://testserver")
+    client._http = echo_server
+    return client
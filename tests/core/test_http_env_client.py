@@ -0,0 +1,230 @@
+import socket
+from typing import Any, Dict
+
+import pytest
+import requests
+import urllib3
+
+from core import http_env_client
+from core.client_types import StepResult
+from core.http_env_client import BatchStepError, HTTPEnvClient
+from envs.echo_env.models import EchoAction
+
+
+class DummyEnv(HTTPEnvClient[Dict[str, Any], Dict[str, Any]]):
+    def _step_payload(self, action: Dict[str, Any]) -> dict:
+        return action
+
+    def _parse_result(self, payload: dict) -> StepResult[Dict[str, Any]]:
+        return StepResult(
+            observation=payload.get("observation", {}),
+            reward=payload.get("reward"),
+            done=payload.get("done", False),
+        )
+
+    def _parse_state(self, payload: dict) -> Any:
+        return payload
+
+
+def test_read_timeout_is_not_retried_or_rewrapped():
+    """A GET that times out while reading surfaces as requests.Timeout."""
+    # Listening socket that completes the handshake but never answers
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        env = DummyEnv(base_url=f"http://127.0.0.1:{port}", request_timeout_s=0.2)
+        with pytest.raises(requests.Timeout):
+            env.state()
+
+
+def test_refused_connection_is_retried(monkeypatch):
+    """Connection failures are retried before raising ConnectionError."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    attempts = []
+    create_connection = urllib3.util.connection.create_connection
+
+    def counting_create_connection(*args, **kwargs):
+        attempts.append(args[0])
+        return create_connection(*args, **kwargs)
+
+    monkeypatch.setattr(
+        urllib3.util.connection, "create_connection", counting_create_connection
+    )
+
+    env = DummyEnv(base_url=f"http://127.0.0.1:{port}")
+    with pytest.raises(requests.ConnectionError):
+        env.reset()
+
+    assert len(attempts) == 4  # first try + 3 retries
+
+
+def test_close_releases_session(monkeypatch):
+    """close() closes the pooled HTTP session."""
+    env = DummyEnv(base_url="http://localhost:9999")
+    closed = []
+    monkeypatch.setattr(env._http, "close", lambda: closed.append(True))
+    env.close()
+    assert closed == [True]
+
+
+def test_batch_step_round_trip(echo_client):
+    """batch_step() sends all actions in one request and parses each result."""
+    results = echo_client.batch_step([EchoAction(message="hi"), EchoAction(message="there")])
+
+    assert [r.observation.echoed_message for r in results] == ["hi", "there"]
+    assert [r.reward for r in results] == [0.2, 0.5]
+
+
+def test_batch_step_raises_with_partial_results(monkeypatch, echo_env, echo_client):
+    """A failing action raises BatchStepError carrying the applied results."""
+    step = echo_env.step
+
+    def step_or_fail(action):
+        if action.message == "boom":
+            raise RuntimeError("step failed")
+        return step(action)
+
+    monkeypatch.setattr(echo_env, "step", step_or_fail)
+
+    with pytest.raises(BatchStepError) as exc_info:
+        echo_client.batch_step([EchoAction(message="ok"), EchoAction(message="boom")])
+
+    assert exc_info.value.index == 1
+    assert [r.observation.echoed_message for r in exc_info.value.results] == ["ok"]
+
+
+def test_batch_step_timeout_scales_with_batch_size(monkeypatch):
+    """The default batch timeout is the per-step timeout times the batch size."""
+    env = DummyEnv(base_url="http://localhost:9999", request_timeout_s=2.0)
+    timeouts = []
+
+    class Response:
+        content = b'{"results": []}'
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"results": []}
+
+    def fake_post(url, json, headers, timeout):
+        timeouts.append(timeout)
+        return Response()
+
+    monkeypatch.setattr(env._http, "post", fake_post)
+    env.batch_step([{}, {}, {}])
+    env.batch_step([])
+    env.batch_step([{}], timeout_s=30.0)
+
+    assert timeouts == [6.0, 2.0, 30.0]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decode_with_and_without_orjson(monkeypatch, echo_client, use_orjson):
+    """Responses decode identically whether or not orjson is available."""
+    if not use_orjson:
+        monkeypatch.setattr(http_env_client, "orjson", None)
+    elif http_env_client.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    env = echo_client
+    assert env.reset().observation.echoed_message == "Echo environment ready!"
+    result = env.step(EchoAction(message="hello"))
+    assert result.observation.message_length == 5
+    assert env.state().step_count == 1
+
+
+def test_step_result_has_no_instance_dict():
+    """StepResult is slotted since one is allocated per step."""
+    result = StepResult(observation={}, reward=1.0)
+    assert not hasattr(result, "__dict__")
+    assert (result.observation, result.reward, result.done) == ({}, 1.0, False)
+
+
+class FakeProvider:
+    def __init__(self):
+        self.stopped = False
+
+    def start_container(self, image, **kwargs):
+        return "http://localhost:9999"
+
+    def wait_for_ready(self, base_url, timeout_s=30.0):
+        pass
+
+    def stop_container(self):
+        self.stopped = True
+
+
+def test_from_docker_image_warms_up_pooled_connection(monkeypatch):
+    """from_docker_image() opens the client's session with a /health request."""
+    requested = []
+
+    def fake_get(self, url, **kwargs):
+        requested.append((url, kwargs.get("headers")))
+
+    monkeypatch.setattr("requests.Session.get", fake_get)
+
+    class AuthEnv(DummyEnv):
+        def __init__(self, **kwargs):
+            super().__init__(default_headers={"Authorization": "Bearer t"}, **kwargs)
+
+    env = AuthEnv.from_docker_image("dummy:latest", provider=FakeProvider())
+
+    assert requested == [
+        ("http://localhost:9999/health", {"Authorization": "Bearer t"})
+    ]
+    assert env._base == "http://localhost:9999"
+
+
+def test_context_manager_closes_client(monkeypatch):
+    """Leaving a with-block closes the session and stops the container."""
+    monkeypatch.setattr("requests.Session.get", lambda self, url, **kwargs: None)
+    provider = FakeProvider()
+
+    with DummyEnv.from_docker_image("dummy:latest", provider=provider) as env:
+        assert isinstance(env, DummyEnv)
+        assert not provider.stopped
+
+    assert provider.stopped
+
+
+def make_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_decode_keeps_wide_ints_exact_without_orjson(monkeypatch):
+    monkeypatch.setattr(http_env_client, "orjson", None)
+    value = http_env_client._decode_json(make_response(b"123456789012345678901234567890"))
+    assert value == 123456789012345678901234567890
+
+
+def test_decode_with_orjson_turns_wide_ints_into_floats(monkeypatch):
+    """Documented trade-off of the optional `fast` extra."""
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(http_env_client, "orjson", orjson)
+    value = http_env_client._decode_json(make_response(b"123456789012345678901234567890"))
+    assert isinstance(value, float)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decode_non_json_body_raises_request_exception(monkeypatch, use_orjson):
+    """A non-JSON body (e.g. an HTML error page) raises the same requests
+    exception whichever decoder is active."""
+    if use_orjson:
+        monkeypatch.setattr(http_env_client, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(http_env_client, "orjson", None)
+
+    response = make_response(b"<html>Starting Space...</html>")
+    with pytest.raises(requests.exceptions.JSONDecodeError) as exc_info:
+        http_env_client._decode_json(response)
+
+    assert isinstance(exc_info.value, requests.RequestException)
@@ -0,0 +1,89 @@
+def test_batch_step_executes_actions_in_order(echo_env, echo_server):
+    env, client = echo_env, echo_server
+    client.post("/reset", json={})
+
+    response = client.post(
+        "/batch_step",
+        json={"actions": [{"message": "a"}, {"message": "bb"}, {"message": "ccc"}]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["observation"]["echoed_message"] for r in results] == ["a", "bb", "ccc"]
+    assert [r["observation"]["message_length"] for r in results] == [1, 2, 3]
+    assert env.state.step_count == 3
+
+
+def test_batch_step_stops_after_done(monkeypatch, echo_env, echo_server):
+    env, client = echo_env, echo_server
+    step = env.step
+
+    def step_until_done(action):
+        observation = step(action)
+        observation.done = action.message == "end"
+        return observation
+
+    monkeypatch.setattr(env, "step", step_until_done)
+
+    response = client.post(
+        "/batch_step",
+        json={"actions": [{"message": "end"}, {"message": "skipped"}]},
+    )
+
+    results = response.json()["results"]
+    assert len(results) == 1
+    assert results[0]["done"] is True
+
+
+def test_batch_step_rejects_invalid_batch_before_stepping(echo_env, echo_server):
+    echo_server.post("/reset", json={})
+
+    response = echo_server.post(
+        "/batch_step",
+        json={"actions": [{"message": "a"}, {"bogus": 1}]},
+    )
+
+    assert response.status_code == 422
+    assert "index 1" in response.json()["detail"]
+    assert echo_env.state.step_count == 0
+
+
+def test_batch_step_reports_partial_results_on_step_error(
+    monkeypatch, echo_env, echo_server
+):
+    step = echo_env.step
+
+    def step_or_fail(action):
+        if action.message == "boom":
+            raise RuntimeError("step failed")
+        return step(action)
+
+    monkeypatch.setattr(echo_env, "step", step_or_fail)
+
+    response = echo_server.post(
+        "/batch_step",
+        json={"actions": [{"message": "a"}, {"message": "boom"}, {"message": "c"}]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["observation"]["echoed_message"] for r in body["results"]] == ["a"]
+    assert body["error"] == {"index": 1, "message": "RuntimeError: step failed"}
+    assert echo_env.state.step_count == 1
+
+
+def test_batch_step_empty(echo_server):
+    response = echo_server.post("/batch_step", json={"actions": []})
+    assert response.json() == {"results": []}
+
+
+def test_large_responses_are_gzipped(echo_server):
+    client = echo_server
+
+    small = client.post("/step", json={"action": {"message": "hi"}})
+    large = client.post("/step", json={"action": {"message": "x" * 4096}})
+
+    assert "content-encoding" not in small.headers
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.json()["observation"]["message_length"] == 4096
+
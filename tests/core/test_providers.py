@@ -0,0 +1,42 @@
+import pytest
+import requests
+
+from core.containers.runtime import LocalDockerProvider
+
+
+@pytest.fixture
+def provider():
+    # Skip __init__, which shells out to `docker version`
+    return LocalDockerProvider.__new__(LocalDockerProvider)
+
+
+class FakeResponse:
+    status_code = 200
+
+
+def test_wait_for_ready_backs_off_exponentially(monkeypatch, provider):
+    sleeps = []
+    attempts = iter([False] * 6 + [True])
+
+    def fake_get(url, timeout):
+        if next(attempts):
+            return FakeResponse()
+        raise requests.ConnectionError()
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    provider.wait_for_ready("http://localhost:9999", timeout_s=60.0)
+
+    assert sleeps == [0.05, 0.1, 0.2, 0.4, 0.8, 1.0]
+
+
+def test_wait_for_ready_times_out(monkeypatch, provider):
+    def fake_get(url, timeout):
+        raise requests.ConnectionError()
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr("time.sleep", lambda s: None)
+
+    with pytest.raises(TimeoutError):
+        provider.wait_for_ready("http://localhost:9999", timeout_s=0.01)